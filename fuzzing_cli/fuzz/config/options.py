@@ -148,21 +148,14 @@ class FuzzingOptions(BaseSettings):
 
     @property
     def addresses_under_test(self) -> List[str]:
+        # the field validators already lower-case the addresses and split
+        # comma-separated strings at construction time, so the property only
+        # assembles the list
         addresses = []
         if self.deployed_contract_address:
-            addresses.append(self.deployed_contract_address.lower())
+            addresses.append(self.deployed_contract_address)
         if self.additional_contracts_addresses:
-            if isinstance(self.additional_contracts_addresses, str):
-                addresses.extend(
-                    [
-                        addr.strip().lower()
-                        for addr in self.additional_contracts_addresses.split(",")
-                    ]
-                )
-            else:
-                addresses.extend(
-                    [addr.lower() for addr in self.additional_contracts_addresses]
-                )
+            addresses.extend(self.additional_contracts_addresses)
         return addresses
 
     class Config(BaseModelConfig):
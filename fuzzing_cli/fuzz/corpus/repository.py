@@ -1,7 +1,7 @@
 import functools
 import logging
+import os
 from collections import defaultdict
-from os.path import commonpath
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
@@ -40,6 +40,11 @@ class CorpusRepository:
         self._rpc = rpc
         self._artifacts = artifacts
         self._options = options
+        # path normalization is pure for a given artifacts instance and the
+        # validation loops below hit the same source paths over and over
+        self._normalize_path = functools.lru_cache(maxsize=None)(
+            self._artifacts.normalize_path
+        )
         (
             self._address_to_contract_mapping,
             self._contract_to_address_mapping,
@@ -110,11 +115,18 @@ class CorpusRepository:
             suggested_seed_seqs.extend(lesson["transactions"])
         return blocks_to_skip, suggested_seed_seqs
 
+    @functools.lru_cache(maxsize=None)
     def _get_contract_by_address(
         self,
         contract_address: CONTRACT_ADDRESS,
     ) -> Optional[Contract]:
-        """Get the artifacts of the contracts at the given addresses"""
+        """Get the artifacts of the contracts at the given addresses
+
+        The result is cached per address: the mapping construction, the
+        validation passes and the re-validation after an auto-fix all
+        resolve the same addresses, and each uncached resolution costs a
+        bytecode fetch plus an artifact search.
+        """
         deployed_bytecode = self._rpc.get_code(contract_address)
         if deployed_bytecode is None:  # it's unknown contract
             LOGGER.warning(
@@ -153,6 +165,9 @@ class CorpusRepository:
         # source file to contract addresses mapping. One source file can have multiple contracts, so we need to
         # keep track of all the contracts addresses for a given source file
         source_file_to_address_mapping = defaultdict(list)
+        # fetch the bytecode of all the deployed contracts up front, so the
+        # per-address resolution below doesn't pay one round-trip per contract
+        self._rpc.prefetch_codes(self.all_deployed_contracts_addresses)
         for contract_address in self.all_deployed_contracts_addresses:
             contract = self._get_contract_by_address(contract_address)
             if contract is None:
@@ -174,24 +189,33 @@ class CorpusRepository:
     def _path_inclusion_checker(paths: List[Path]):
         """Construct a function that checks if a given path is in the list of paths.
         The paths can be files or folders"""
-        directory_paths: List[Path] = []
-        file_paths: List[Path] = []
+        directory_paths: List[str] = []
+        file_paths: List[str] = []
         for _path in paths:
             if _path.is_dir():
-                directory_paths.append(_path)
+                directory_paths.append(str(_path).rstrip(os.sep))
             else:
-                file_paths.append(_path)
-
-        def inner_checker(path: Union[str, Path]):
-            if path in file_paths:
-                # we have found exact file match
+                file_paths.append(str(_path))
+
+        # a path is inside a directory iff it starts with the directory path
+        # followed by a separator, so a plain prefix comparison replaces the
+        # per-call `os.path.commonpath` splitting and allocations
+        directory_prefixes = tuple(d + os.sep for d in directory_paths)
+        exact_paths = frozenset(file_paths) | frozenset(directory_paths)
+
+        # bind the lookup structures as default arguments: the checker runs
+        # once per contract and local loads are cheaper than closure cells
+        def inner_checker(
+            path: Union[str, Path],
+            _exact_paths=exact_paths,
+            _directory_prefixes=directory_prefixes,
+        ):
+            path = str(path)
+            if path in _exact_paths:
+                # we have found exact file (or directory) match
                 return True
             # try to find folder match
-            for dir_path in directory_paths:
-                if commonpath([dir_path, path]) == dir_path:
-                    # file is in the directory
-                    return True
-            return False
+            return any(path.startswith(prefix) for prefix in _directory_prefixes)
 
         return inner_checker
 
@@ -217,7 +241,7 @@ class CorpusRepository:
         try:
             blocks_to_skip, suggested_seed_seqs = self._fuzzing_lessons
             processed_transactions = self._rpc.get_transactions(
-                block_numbers_to_skip=list(blocks_to_skip)
+                block_numbers_to_skip=blocks_to_skip
             )
 
             if len(processed_transactions) == 0:
@@ -270,10 +294,15 @@ class CorpusRepository:
         not_deployed_contracts = []
 
         processed_source_targets = [
-            self._artifacts.normalize_path(s) for s in self.source_targets
+            self._normalize_path(s) for s in self.source_targets
         ]
         path_check = self._path_inclusion_checker(processed_source_targets)
 
+        # compute the membership sets once instead of scanning the lists
+        # for every checked contract
+        deployed_contracts_addresses = set(self.all_deployed_contracts_addresses)
+        contract_targets = set(self.contract_targets)
+
         # These are the contracts that are deployed on the RPC, but we can't find them using the
         # `rpc.get_all_deployed_contracts_addresses`. This can happen if the contract was deployed
         # from another contract (factory contract).
@@ -282,7 +311,7 @@ class CorpusRepository:
 
         for contract_address in self.contract_targets:
             # 1. All contracts deployed at the addresses specified in the addresses_under_test are found on the RPC.
-            if contract_address not in self.all_deployed_contracts_addresses:
+            if contract_address not in deployed_contracts_addresses:
                 contract = self._get_contract_by_address(contract_address)
                 if contract:
                     discovered_contracts[contract_address] = contract
@@ -304,15 +333,13 @@ class CorpusRepository:
                 contracts_with_no_artifact.append(contract_address)
                 continue
             # 4. All contracts provided as addresses under test have a corresponding target provided as well.
-            if not path_check(
-                self._artifacts.normalize_path(contract["mainSourceFile"])
-            ):
+            if not path_check(self._normalize_path(contract["mainSourceFile"])):
                 # This is a contract that's been provided as address under test,
                 # but its source file was not provided as a target
                 source_target_not_set.append(
                     (
                         contract_address,
-                        self._artifacts.normalize_path(contract["mainSourceFile"]),
+                        self._normalize_path(contract["mainSourceFile"]),
                     )
                 )
 
@@ -320,12 +347,10 @@ class CorpusRepository:
             # here we use path_check because target could be a directory,
             # so we need to check if the source file is in the directory
             # if the target is a file, then path_check will just check if the source file is the same as the target
-            source_file_name = self._artifacts.normalize_path(source_file_name)
+            source_file_name = self._normalize_path(source_file_name)
             _path_check = self._path_inclusion_checker([source_file_name])
             for contract in self._artifacts.contracts:
-                if not _path_check(
-                    self._artifacts.normalize_path(contract["mainSourceFile"])
-                ):
+                if not _path_check(self._normalize_path(contract["mainSourceFile"])):
                     continue
                 contract_address = self._contract_to_address_mapping.get(
                     self._contract_key(contract), None
@@ -338,7 +363,7 @@ class CorpusRepository:
                     continue
                 # 5. All contracts provided as targets (source file name) have a corresponding
                 # deployed contract's address provided as an address under test.
-                if contract_address not in self.contract_targets:
+                if contract_address not in contract_targets:
                     contract_target_not_set.append(
                         (contract_address, source_file_name, contract["contractName"])
                     )
@@ -357,7 +382,12 @@ class CorpusRepository:
         ):
             if contract_address in targets_in_use:
                 continue
-            contract = self._get_contract_by_address(contract_address)
+            # every address here has been resolved either while building the
+            # address-to-contract mapping or in the discovery pass above, so
+            # reuse those results instead of fetching the bytecode again
+            contract = self._address_to_contract_mapping.get(
+                contract_address, None
+            ) or discovered_contracts.get(contract_address, None)
             if contract is None:
                 # This is the contract without the artifact which should be caught by the previous checks,
                 # so we skip it here
@@ -365,7 +395,7 @@ class CorpusRepository:
             not_targeted_contracts.append(
                 (
                     contract_address,
-                    self._artifacts.normalize_path(contract.get("mainSourceFile")),
+                    self._normalize_path(contract.get("mainSourceFile")),
                     contract.get("contractName"),
                 )
             )
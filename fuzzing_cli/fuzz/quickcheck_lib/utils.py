@@ -1,13 +1,15 @@
+from typing import Iterable, List, Union
+
 import rlp
 from Crypto.Hash import keccak
 
 
-def mk_contract_address(sender: str, nonce: int, prefix=False) -> str:
+def mk_contract_address(sender: Union[str, bytes], nonce: int, prefix=False) -> str:
     """
     A contract address is derived from the sender address and the nonce using keccak256.
 
     Parameters:
-    sender (str): The sender address.
+    sender (Union[str, bytes]): The sender address (hex string or raw bytes).
     nonce (int): The nonce of the sender's account.
     prefix (bool): Whether to prefix the address with 0x.
 
@@ -15,10 +17,55 @@ def mk_contract_address(sender: str, nonce: int, prefix=False) -> str:
     str: The contract address.
     """
 
-    sender_address = bytes.fromhex(sender)
+    sender_address = bytes.fromhex(sender) if isinstance(sender, str) else sender
     address = keccak.new(
         digest_bits=256, data=rlp.encode([sender_address, nonce])
     ).digest()[12:]
     if prefix:
         return f"0x{address.hex().lower()}"
     return address.hex().lower()
+
+
+def _rlp_encode_nonce(nonce: int) -> bytes:
+    """RLP-encode a non-negative integer (the account nonce)."""
+    if nonce == 0:
+        return b"\x80"
+    nonce_bytes = nonce.to_bytes((nonce.bit_length() + 7) // 8, "big")
+    if nonce < 0x80:
+        return nonce_bytes
+    return bytes([0x80 + len(nonce_bytes)]) + nonce_bytes
+
+
+def mk_contract_addresses_for_sender(
+    sender: Union[str, bytes], nonces: Iterable[int], prefix=False
+) -> List[str]:
+    """
+    Derive the contract addresses for multiple nonces of a single sender.
+
+    The RLP encoding of the hashed [sender, nonce] pair only differs in the
+    nonce field between the nonces, so the sender part is encoded once and
+    only the short nonce encoding is computed per address.
+
+    Parameters:
+    sender (Union[str, bytes]): The sender address (hex string or raw bytes).
+    nonces (Iterable[int]): The nonces of the sender's account.
+    prefix (bool): Whether to prefix the addresses with 0x.
+
+    Returns:
+    List[str]: The contract addresses, in the order of the given nonces.
+    """
+
+    sender_address = bytes.fromhex(sender) if isinstance(sender, str) else sender
+    # RLP of a 20-byte string is a one-byte length prefix followed by the bytes
+    encoded_sender = bytes([0x80 + len(sender_address)]) + sender_address
+    addresses = []
+    for nonce in nonces:
+        payload = encoded_sender + _rlp_encode_nonce(nonce)
+        # the payload is at most 30 bytes, so the list header is a single byte
+        address = keccak.new(
+            digest_bits=256, data=bytes([0xC0 + len(payload)]) + payload
+        ).digest()[12:]
+        addresses.append(
+            f"0x{address.hex().lower()}" if prefix else address.hex().lower()
+        )
+    return addresses
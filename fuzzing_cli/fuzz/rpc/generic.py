@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from fuzzing_cli.fuzz.types import EVMBlock, EVMTransaction
 
@@ -7,7 +7,10 @@ from fuzzing_cli.fuzz.types import EVMBlock, EVMTransaction
 class RPCClientBase(ABC):
     @abstractmethod
     def get_block(
-        self, latest: bool = False, block_number: int = -1
+        self,
+        latest: bool = False,
+        block_number: int = -1,
+        include_transactions: bool = True,
     ) -> Optional[EVMBlock]:  # pragma: no cover
         ...
 
@@ -31,6 +34,6 @@ class RPCClientBase(ABC):
     def get_transactions(
         self,
         blocks: Optional[List[EVMBlock]] = None,
-        block_numbers_to_skip: List[str] = [],
+        block_numbers_to_skip: Iterable[str] = (),
     ) -> List[EVMTransaction]:  # pragma: no cover
         ...
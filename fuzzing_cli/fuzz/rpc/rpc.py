@@ -1,22 +1,43 @@
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import click
 import requests
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # orjson does not support PyPy; use the stdlib codec there
+    json_dumps = json.dumps
+    json_loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
 
 from fuzzing_cli.fuzz.exceptions import RPCCallError
-from fuzzing_cli.fuzz.quickcheck_lib.utils import mk_contract_address
+from fuzzing_cli.fuzz.quickcheck_lib.utils import mk_contract_addresses_for_sender
 from fuzzing_cli.fuzz.types import DebugTraceResult, EVMBlock, EVMTransaction, StructLog
 
 from .generic import RPCClientBase
 
 LOGGER = logging.getLogger("fuzzing-cli")
 
-headers = {"Content-Type": "application/json"}
 NUM_BLOCKS_UPPER_LIMIT = 9999
+# Number of requests to put into a single JSON-RPC batch call
+BATCH_SIZE = 200
+# Number of connections to keep in the connection pool and the number
+# of worker threads dispatching the requests
+POOL_SIZE = 16
+# Time (in seconds) during which a fetched latest block number is reused
+# instead of being queried from the node again
+LATEST_BLOCK_NUMBER_TTL = 0.5
 
 SEED_STATE = Dict[str, Any]
 CONTRACT_ADDRESS = str
@@ -27,6 +48,19 @@ class RPCClient(RPCClientBase):
     def __init__(self, rpc_url: str, number_of_cores: int = 1):
         self.rpc_url = rpc_url
         self.number_of_cores = number_of_cores
+        # reuse TCP connections between the calls instead of setting up
+        # a new one for every request
+        self._session = requests.Session()
+        # set once on the session instead of rebuilding the headers per call
+        self._session.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=2
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._executor = ThreadPoolExecutor(max_workers=POOL_SIZE)
+        self._code_cache: Dict[CONTRACT_ADDRESS, Optional[CONTRACT_BYTECODE]] = {}
+        self._latest_block_number_cache: Tuple[float, int] = (0.0, -1)
 
     @staticmethod
     def parse_rpc_node_kind(rpc_node_info: Optional[str]) -> Optional[str]:
@@ -63,27 +97,73 @@ class RPCClient(RPCClientBase):
         """
         try:
             payload = {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
-            response = (
-                requests.request("POST", self.rpc_url, headers=headers, json=payload)
-            ).json()
+            response = json_loads(
+                self._session.post(self.rpc_url, data=json_dumps(payload)).content
+            )
             result = response.get("result", None)
             if result is None and response.get("error"):
                 LOGGER.debug(f"RPC call error: {json.dumps(response['error'])}")
             return result
-        except RequestException as e:
+        except (RequestException, JSONDecodeError) as e:
             raise RPCCallError(
                 f"HTTP error calling RPC method {method} with parameters: {params}"
                 f"\nAre you sure the RPC is running at {self.rpc_url}?"
             )
 
+    def call_batch(
+        self, calls: List[Tuple[str, List[Union[str, bool, int, float]]]]
+    ) -> List[Optional[Any]]:
+        """Make a batched rpc call (multiple requests in one HTTP round-trip)
+        to the RPC endpoint
+
+        :return: Result properties of the RPC responses in the order
+            of the provided calls
+        """
+        if not calls:
+            return []
+        try:
+            payload = [
+                {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+                for i, (method, params) in enumerate(calls)
+            ]
+            response = json_loads(
+                self._session.post(self.rpc_url, data=json_dumps(payload)).content
+            )
+            if not isinstance(response, list):
+                # per JSON-RPC 2.0, a node that rejects or does not support
+                # batch requests returns a single error object; fall back to
+                # issuing the calls one by one
+                LOGGER.debug(f"RPC batch call rejected: {json.dumps(response)}")
+                return [self.call(method, params) for method, params in calls]
+            results: Dict[int, Any] = {}
+            for item in response:
+                result = item.get("result", None)
+                if result is None and item.get("error"):
+                    LOGGER.debug(f"RPC call error: {json.dumps(item['error'])}")
+                results[item["id"]] = result
+            return [results.get(i) for i in range(len(calls))]
+        except (RequestException, JSONDecodeError) as e:
+            methods = ", ".join(sorted({method for method, _ in calls}))
+            raise RPCCallError(
+                f"HTTP error calling batched RPC methods: {methods}"
+                f"\nAre you sure the RPC is running at {self.rpc_url}?"
+            )
+
     def get_block(
-        self, latest: bool = False, block_number: int = -1
+        self,
+        latest: bool = False,
+        block_number: int = -1,
+        include_transactions: bool = True,
     ) -> Optional[EVMBlock]:
-        block_value = "latest" if latest else str(block_number)
-        if not latest:
-            block_value = hex(block_number)
+        """Get a block from the RPC endpoint
 
-        block = self.call("eth_getBlockByNumber", [block_value, True])
+        With ``include_transactions=False`` the node returns transaction
+        hashes instead of full transaction objects, which is considerably
+        cheaper to transfer and decode when only the block metadata is
+        needed.
+        """
+        block_value = "latest" if latest else hex(block_number)
+        block = self.call("eth_getBlockByNumber", [block_value, include_transactions])
         return block
 
     def get_block_by_hash(self, hash: str) -> Optional[EVMBlock]:
@@ -93,13 +173,85 @@ class RPCClient(RPCClientBase):
     def get_code(
         self, contract_address: CONTRACT_ADDRESS
     ) -> Optional[CONTRACT_BYTECODE]:
+        if contract_address in self._code_cache:
+            return self._code_cache[contract_address]
         deployed_bytecode = self.call("eth_getCode", [contract_address, "latest"])
         if deployed_bytecode == "0x":
-            return None
+            deployed_bytecode = None
+        self._code_cache[contract_address] = deployed_bytecode
         return deployed_bytecode
 
+    def prefetch_codes(self, contract_addresses: Iterable[CONTRACT_ADDRESS]) -> None:
+        """Warm the bytecode cache by fetching the code of the not yet
+        cached addresses in batched rpc calls
+
+        Subsequent ``get_code`` calls for these addresses are served from
+        the cache instead of issuing one serial round-trip each.
+        """
+        missing = [
+            contract_address
+            for contract_address in dict.fromkeys(contract_addresses)
+            if contract_address not in self._code_cache
+        ]
+        if not missing:
+            return
+        chunks = [
+            [
+                ("eth_getCode", [contract_address, "latest"])
+                for contract_address in missing[chunk_start : chunk_start + BATCH_SIZE]
+            ]
+            for chunk_start in range(0, len(missing), BATCH_SIZE)
+        ]
+        codes: List[Optional[CONTRACT_BYTECODE]] = []
+        for chunk_codes in self._executor.map(self.call_batch, chunks):
+            codes.extend(chunk_codes)
+        for contract_address, deployed_bytecode in zip(missing, codes):
+            self._code_cache[contract_address] = (
+                None if deployed_bytecode == "0x" else deployed_bytecode
+            )
+
+    def _first_block_with_transactions(self, num_of_blocks: int) -> int:
+        """Find the number of the earliest block containing transactions
+
+        Long-running development nodes accumulate a run of empty blocks
+        before the first transaction is mined. Probe the chain at
+        exponentially growing block numbers with lightweight requests
+        (transaction hashes only) to bound that run, then scan the bounded
+        prefix in batches to locate the exact boundary. Returns
+        ``num_of_blocks`` if the whole chain is empty.
+        """
+
+        def has_transactions(block: Optional[EVMBlock]) -> bool:
+            return bool(block and block["transactions"])
+
+        probe = 1
+        while probe < num_of_blocks - 1:
+            if has_transactions(
+                self.get_block(block_number=probe, include_transactions=False)
+            ):
+                break
+            probe *= 2
+        upper_bound = min(probe, num_of_blocks - 1)
+
+        for chunk_start in range(0, upper_bound + 1, BATCH_SIZE):
+            chunk_end = min(chunk_start + BATCH_SIZE, upper_bound + 1)
+            chunk = self.call_batch(
+                [
+                    ("eth_getBlockByNumber", [hex(i), False])
+                    for i in range(chunk_start, chunk_end)
+                ]
+            )
+            for block_number, block in enumerate(chunk, start=chunk_start):
+                if has_transactions(block):
+                    return block_number
+        return num_of_blocks
+
     def get_all_blocks(self) -> List[EVMBlock]:
-        """Get all blocks from the node running at rpc_url
+        """Get all blocks containing transactions from the node running
+        at rpc_url
+
+        Empty blocks preceding the first transaction on the chain are
+        skipped because they contribute nothing to the seed state.
 
         Raises an exception if the number of blocks
         exceeds 10000 as it is likely a user error who passed the wrong
@@ -115,41 +267,57 @@ class RPCClient(RPCClientBase):
                 + str(self.rpc_url)
                 + " can not exceed 10000. Did you pass the correct RPC url?"
             )
+        first_block = self._first_block_with_transactions(num_of_blocks)
+        chunks = [
+            [
+                ("eth_getBlockByNumber", [hex(i), True])
+                for i in range(
+                    chunk_start, min(chunk_start + BATCH_SIZE, num_of_blocks)
+                )
+            ]
+            for chunk_start in range(first_block, num_of_blocks, BATCH_SIZE)
+        ]
         blocks = []
-        for i in range(0, num_of_blocks):
-            blocks.append(self.get_block(block_number=i))
+        # dispatch the batches concurrently to overlap the network round-trips
+        for chunk_blocks in self._executor.map(self.call_batch, chunks):
+            blocks.extend(chunk_blocks)
         return blocks
 
     def get_latest_block_number(self) -> int:
-        latest_block = self.get_block(latest=True)
-        if not latest_block:
-            return -1
-        num_of_blocks = int(latest_block["number"], 16)
-        return num_of_blocks
+        fetched_at, block_number = self._latest_block_number_cache
+        if time.monotonic() - fetched_at < LATEST_BLOCK_NUMBER_TTL:
+            return block_number
+        latest_block = self.get_block(latest=True, include_transactions=False)
+        block_number = int(latest_block["number"], 16) if latest_block else -1
+        self._latest_block_number_cache = (time.monotonic(), block_number)
+        return block_number
 
     def get_transactions(
         self,
         blocks: Optional[List[EVMBlock]] = None,
-        block_numbers_to_skip: List[str] = [],
+        block_numbers_to_skip: Iterable[str] = (),
     ) -> List[EVMTransaction]:
         if not blocks:
             blocks = self.get_all_blocks()
+        # make lookups O(1) in the loop below
+        block_numbers_to_skip = set(block_numbers_to_skip)
         processed_transactions = []
         for block in blocks:
             if block["number"] in block_numbers_to_skip:
                 continue
+            # these fields are the same for every transaction in the block,
+            # so build them once instead of once per transaction
+            block_fields = {
+                "blockCoinbase": block["miner"],
+                "blockDifficulty": block["difficulty"],
+                "blockGasLimit": block["gasLimit"],
+                "blockTimestamp": block["timestamp"],
+            }
             for transaction in block["transactions"]:
-                for key, value in dict(transaction).items():
-                    if value is None:
+                for key in transaction:
+                    if transaction[key] is None:
                         transaction[key] = ""
-                transaction.update(
-                    {
-                        "blockCoinbase": block["miner"],
-                        "blockDifficulty": block["difficulty"],
-                        "blockGasLimit": block["gasLimit"],
-                        "blockTimestamp": block["timestamp"],
-                    }
-                )
+                transaction.update(block_fields)
                 processed_transactions.append(transaction)
         return processed_transactions
 
@@ -224,25 +392,35 @@ class RPCClient(RPCClientBase):
     def get_all_deployed_contracts_addresses(
         self, blocks_to_skip: Set[str]
     ) -> List[CONTRACT_ADDRESS]:
-        transactions = self.get_transactions(block_numbers_to_skip=list(blocks_to_skip))
+        transactions = self.get_transactions(block_numbers_to_skip=blocks_to_skip)
 
         # This is the list of all the contract addresses that are deployed(created)
-        # in the rpc node.
-        contracts = []
+        # in the rpc node. Each transaction gets a slot holding the addresses
+        # it created, so the returned order matches the transaction order even
+        # though the creation transactions are derived per sender below.
+        slots: List[List[CONTRACT_ADDRESS]] = []
+        creations_by_sender: Dict[str, List[Tuple[List[CONTRACT_ADDRESS], int]]] = {}
         for txn in transactions:
             if not txn["to"]:
                 # this is a contract creation transaction (with "to" set to null)
-                contracts.append(
-                    mk_contract_address(
-                        txn["from"][2:], int(txn["nonce"], base=16), prefix=True
-                    )
+                slot: List[CONTRACT_ADDRESS] = []
+                creations_by_sender.setdefault(txn["from"], []).append(
+                    (slot, int(txn["nonce"], base=16))
                 )
-                continue
-            # this is not an obvious contract creation transaction, but another contracts could be deployed
-            # in an internal transactions (e.g. Factory pattern, where a contract creates
-            # another contract in some method).
-            contracts.extend(
-                self.get_internally_created_contracts(txn["hash"]),
+            else:
+                # this is not an obvious contract creation transaction, but another contracts could be deployed
+                # in an internal transactions (e.g. Factory pattern, where a contract creates
+                # another contract in some method).
+                slot = self.get_internally_created_contracts(txn["hash"])
+            slots.append(slot)
+
+        # derive the created contract addresses in one pass per sender, so the
+        # RLP-encoded sender prefix is computed once instead of per transaction
+        for sender, creations in creations_by_sender.items():
+            addresses = mk_contract_addresses_for_sender(
+                sender[2:], [nonce for _, nonce in creations], prefix=True
             )
+            for (slot, _), address in zip(creations, addresses):
+                slot.append(address)
 
-        return contracts
+        return [address for slot in slots for address in slot]
@@ -181,12 +181,10 @@ def get_code_mocker(contracts: Dict[str, any]):
 
 @contextmanager
 def mocked_rpc_client(blocks: List[EVMBlock], codes: Dict[str, str] = {}):
-    def request_handler(request: requests.Request, context):
-        payload: Dict[str, any] = json.loads(request.text)
+    def handle_call(payload: Dict[str, any]):
         method = payload.get("method")
         params = payload.get("params")
-        context.status_code = 200
-        response_body = {"id": 1, "jsonrpc": "2.0", "result": None}
+        response_body = {"id": payload.get("id", 1), "jsonrpc": "2.0", "result": None}
         if method == "eth_getBlockByNumber":
             if params[0] == "latest":
                 return {**response_body, "result": blocks[-1]}
@@ -204,6 +202,13 @@ def mocked_rpc_client(blocks: List[EVMBlock], codes: Dict[str, str] = {}):
             return {**response_body, "result": "test/0.0.1"}
         return response_body
 
+    def request_handler(request: requests.Request, context):
+        payload: Union[Dict[str, any], List[Dict[str, any]]] = json.loads(request.text)
+        context.status_code = 200
+        if isinstance(payload, list):  # it's a JSON-RPC batch request
+            return [handle_call(p) for p in payload]
+        return handle_call(payload)
+
     with requests_mock.Mocker() as m:
         m.register_uri("POST", "http://localhost:9898", json=request_handler)
         yield m
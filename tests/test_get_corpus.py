@@ -39,6 +39,8 @@ def truffle_mocked_context_invoke(
     with patch.object(RPCClient, "get_all_blocks") as get_all_blocks_mock, patch.object(
         RPCClient, "get_code"
     ) as get_code_mock, patch.object(
+        RPCClient, "prefetch_codes", new=Mock(return_value=None)
+    ), patch.object(
         RPCClient, "get_internally_created_contracts", new=Mock(return_value=[])
     ), patch.object(
         TruffleArtifacts, "query_truffle_db"
@@ -196,7 +198,7 @@ def test_call_error(api_key, tmp_path):
 
     assert result.exit_code == 1
     assert (
-        f"HTTP error calling RPC method eth_getBlockByNumber with parameters: ['latest', True]"
+        f"HTTP error calling RPC method eth_getBlockByNumber with parameters: ['latest', False]"
         f"\nAre you sure the RPC is running at http://localhost:9898?" in result.output
     )
 
@@ -98,6 +98,8 @@ def test_incremental_fuzzing(
     )
 
     with patch.object(RPCClient, "get_code", Mock(return_value="0x1")), patch.object(
+        RPCClient, "prefetch_codes", Mock(return_value=None)
+    ), patch.object(
         RPCClient,
         "get_all_blocks",
         Mock(return_value=get_test_case("testdata/ganache-all-blocks.json")),
@@ -0,0 +1,37 @@
+import pytest
+import rlp
+from Crypto.Hash import keccak
+
+from fuzzing_cli.fuzz.quickcheck_lib.utils import (
+    mk_contract_address,
+    mk_contract_addresses_for_sender,
+)
+
+SENDER = "7277646075fa72737e1f6114654c5d9949a67df2"
+# nonces around the RLP integer encoding boundaries (empty string, single
+# byte, length-prefixed big-endian integers of growing width)
+BOUNDARY_NONCES = [0, 1, 0x7F, 0x80, 0xFF, 0x100, 2**16, 2**32, 2**64 - 1]
+
+
+@pytest.mark.parametrize("prefix", [True, False])
+def test_matches_single_address_derivation(prefix: bool):
+    addresses = mk_contract_addresses_for_sender(SENDER, BOUNDARY_NONCES, prefix=prefix)
+    assert addresses == [
+        mk_contract_address(SENDER, nonce, prefix=prefix) for nonce in BOUNDARY_NONCES
+    ]
+
+
+def test_matches_rlp_encoding():
+    sender_address = bytes.fromhex(SENDER)
+    addresses = mk_contract_addresses_for_sender(SENDER, BOUNDARY_NONCES)
+    for nonce, address in zip(BOUNDARY_NONCES, addresses):
+        expected = keccak.new(
+            digest_bits=256, data=rlp.encode([sender_address, nonce])
+        ).digest()[12:]
+        assert address == expected.hex().lower()
+
+
+def test_accepts_raw_sender_bytes():
+    assert mk_contract_addresses_for_sender(
+        bytes.fromhex(SENDER), [0], prefix=True
+    ) == [mk_contract_address(SENDER, 0, prefix=True)]
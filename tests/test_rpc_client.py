@@ -0,0 +1,171 @@
+import json
+from typing import List, Optional
+
+import pytest
+import requests_mock
+
+from fuzzing_cli.fuzz.exceptions import RPCCallError
+from fuzzing_cli.fuzz.rpc.rpc import RPCClient
+from tests.common import mocked_rpc_client
+
+RPC_URL = "http://localhost:9898"
+
+
+def make_block(number: int, num_of_transactions: int):
+    return {
+        "number": hex(number),
+        "hash": f"0x{number:064x}",
+        "miner": "0x0000000000000000000000000000000000000000",
+        "difficulty": "0x0",
+        "gasLimit": "0x6691b7",
+        "timestamp": "0x5f6a4ea5",
+        "transactions": [
+            {"hash": f"0x{number:032x}{i:032x}"} for i in range(num_of_transactions)
+        ],
+    }
+
+
+def test_call_batch_empty():
+    with requests_mock.Mocker() as m:
+        client = RPCClient(RPC_URL)
+        assert client.call_batch([]) == []
+        assert m.call_count == 0
+
+
+def test_call_batch_orders_results_by_id():
+    def handler(request, context):
+        payload = json.loads(request.text)
+        context.status_code = 200
+        # respond out of order to make sure the client sorts by request id
+        return [
+            {"jsonrpc": "2.0", "id": call["id"], "result": call["params"][0]}
+            for call in reversed(payload)
+        ]
+
+    with requests_mock.Mocker() as m:
+        m.register_uri("POST", RPC_URL, json=handler)
+        client = RPCClient(RPC_URL)
+        results = client.call_batch(
+            [("eth_getCode", [f"0x{i}", "latest"]) for i in range(5)]
+        )
+
+    assert results == [f"0x{i}" for i in range(5)]
+    assert m.call_count == 1
+
+
+def test_call_batch_returns_none_for_error_entries():
+    def handler(request, context):
+        payload = json.loads(request.text)
+        context.status_code = 200
+        response = []
+        for call in payload:
+            if call["id"] % 2 == 1:
+                response.append(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": call["id"],
+                        "error": {"code": -32000, "message": "method handler crashed"},
+                    }
+                )
+            else:
+                response.append(
+                    {"jsonrpc": "2.0", "id": call["id"], "result": call["params"][0]}
+                )
+        return response
+
+    with requests_mock.Mocker() as m:
+        m.register_uri("POST", RPC_URL, json=handler)
+        client = RPCClient(RPC_URL)
+        results = client.call_batch(
+            [("eth_getCode", [f"0x{i}", "latest"]) for i in range(4)]
+        )
+
+    assert results == ["0x0", None, "0x2", None]
+
+
+def test_call_batch_falls_back_to_serial_calls_on_batch_rejection():
+    def handler(request, context):
+        payload = json.loads(request.text)
+        context.status_code = 200
+        if isinstance(payload, list):
+            # per JSON-RPC 2.0 a node rejecting a batch request returns
+            # a single error object instead of a list
+            return {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32600, "message": "batch requests not supported"},
+            }
+        return {"jsonrpc": "2.0", "id": payload["id"], "result": payload["params"][0]}
+
+    with requests_mock.Mocker() as m:
+        m.register_uri("POST", RPC_URL, json=handler)
+        client = RPCClient(RPC_URL)
+        results = client.call_batch(
+            [("eth_getCode", [f"0x{i}", "latest"]) for i in range(3)]
+        )
+
+    assert results == ["0x0", "0x1", "0x2"]
+    # one rejected batch request plus one request per call
+    assert m.call_count == 4
+
+
+@pytest.mark.parametrize("method", ["call", "call_batch"])
+def test_non_json_response_raises_rpc_call_error(method: str):
+    with requests_mock.Mocker() as m:
+        m.register_uri(
+            "POST", RPC_URL, text="<html>502 Bad Gateway</html>", status_code=502
+        )
+        client = RPCClient(RPC_URL)
+        with pytest.raises(RPCCallError) as e:
+            if method == "call":
+                client.call("eth_getCode", ["0x0", "latest"])
+            else:
+                client.call_batch([("eth_getCode", ["0x0", "latest"])])
+
+    assert f"Are you sure the RPC is running at {RPC_URL}?" in str(e.value)
+
+
+@pytest.mark.parametrize(
+    "num_of_blocks, blocks_with_transactions, first_returned_block",
+    [
+        (1, [], None),  # empty chain (genesis only)
+        (2, [], None),  # all blocks empty
+        (2, [0], 0),  # transactions right from the genesis block
+        (2, [1], 1),  # single transaction in the last block
+        (10, [5, 6, 7, 8, 9], 5),  # first transaction at a non-power-of-two block
+        (10, [3], 3),  # empty blocks both before and after the transaction
+    ],
+)
+def test_get_all_blocks_skips_the_empty_prefix(
+    num_of_blocks: int,
+    blocks_with_transactions: List[int],
+    first_returned_block: Optional[int],
+):
+    blocks = [
+        make_block(i, 1 if i in blocks_with_transactions else 0)
+        for i in range(num_of_blocks)
+    ]
+    with mocked_rpc_client(blocks):
+        client = RPCClient(RPC_URL)
+        fetched_blocks = client.get_all_blocks()
+
+    if first_returned_block is None:
+        assert fetched_blocks == []
+    else:
+        assert fetched_blocks == blocks[first_returned_block:]
+
+
+def test_prefetch_codes_warms_the_bytecode_cache():
+    blocks = [make_block(0, 0)]
+    codes = {
+        "0x0000000000000000000000000000000000000001": "0x6080",
+        "0x0000000000000000000000000000000000000002": "0x",
+    }
+    with mocked_rpc_client(blocks, codes) as m:
+        client = RPCClient(RPC_URL)
+        client.prefetch_codes(list(codes.keys()))
+        requests_made = m.call_count
+        # served from the cache without additional requests
+        assert client.get_code("0x0000000000000000000000000000000000000001") == "0x6080"
+        assert client.get_code("0x0000000000000000000000000000000000000002") is None
+        assert m.call_count == requests_made